@@ -1,16 +1,27 @@
 from flask import Flask, jsonify, request, send_from_directory
-from dotenv import load_dotenv
-import os
-from database import db
-
-# Cargar variables de entorno
-load_dotenv()
+import config
+from compression import Compress
+from uploads import UploadRequest
 
 app = Flask(__name__, static_folder='frontend', static_url_path='')
 
 # Configuración
-app.config['MONGODB_URI'] = os.getenv('MONGODB_URI')
-app.config['SECRET_KEY'] = os.getenv('SESSION_SECRET')
+app.config['MONGODB_URI'] = config.MONGODB_URI
+app.config['SECRET_KEY'] = config.SESSION_SECRET
+app.config['COMPRESS_MIN_SIZE'] = config.COMPRESS_MIN_SIZE
+app.config['COMPRESS_LEVEL'] = config.COMPRESS_LEVEL
+app.config['COMPRESS_BR_LEVEL'] = config.COMPRESS_BR_LEVEL
+app.config['MAX_CONTENT_LENGTH'] = config.MAX_CONTENT_LENGTH
+app.config['MAX_FORM_MEMORY_SIZE'] = config.MAX_FORM_MEMORY_SIZE
+app.config['MAX_FILE_SIZE'] = config.MAX_FILE_SIZE
+app.config['UPLOAD_SPOOL_SIZE'] = config.UPLOAD_SPOOL_SIZE
+app.config['UPLOAD_CHUNK_SIZE'] = config.UPLOAD_CHUNK_SIZE
+
+# Archivos subidos con tamaño limitado y volcados a disco
+app.request_class = UploadRequest
+
+# Compresión gzip/brotli de las respuestas JSON
+Compress(app)
 
 # Rutas para servir el frontend
 @app.route('/')
@@ -25,10 +36,11 @@ def serve_static(path):
 @app.route('/api/config')
 def get_config():
     return jsonify({
-        'googleClientId': os.getenv('GOOGLE_CLIENT_ID')
+        'googleClientId': config.GOOGLE_CLIENT_ID
     })
 
 # Importar y registrar blueprints
+# (las dependencias pesadas de cada blueprint se cargan en su primer uso)
 from routes.auth import auth_bp
 from routes.resenas import resenas_bp
 from routes.upload import upload_bp
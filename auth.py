@@ -1,15 +1,12 @@
 from functools import wraps
 from flask import request, jsonify
 import jwt
-import os
 from datetime import datetime, timedelta, timezone
-from google.oauth2 import id_token
-from google.auth.transport import requests
-import requests as http_requests
+import config
 
 #Logica de autenticación y autorización
-JWT_SECRET = os.getenv('JWT_SECRET')
-GOOGLE_CLIENT_ID = os.getenv('GOOGLE_CLIENT_ID')
+JWT_SECRET = config.JWT_SECRET
+GOOGLE_CLIENT_ID = config.GOOGLE_CLIENT_ID
 
 def create_jwt_token(user_data):
     """Crear un token JWT para el usuario autenticado"""
@@ -36,6 +33,10 @@ def verify_jwt_token(token):
 def verify_google_token(token):
     """Verificar un token de Google OAuth"""
     try:
+        # Importación diferida: google-auth (y requests) solo se cargan al hacer login
+        from google.oauth2 import id_token
+        from google.auth.transport import requests
+
         idinfo = id_token.verify_oauth2_token(
             token, 
             requests.Request(), 
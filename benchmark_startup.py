@@ -0,0 +1,80 @@
+"""
+Benchmark de arranque en frío de la aplicación.
+
+Lanza varios intérpretes nuevos que importan `app` (igual que un cold start
+en Vercel) y muestra:
+- Tiempo de arranque (mínimo, mediana y máximo)
+- Informe de `python -X importtime` con los módulos más costosos
+
+Uso:
+    python benchmark_startup.py [--runs N] [--top N]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+IMPORT_STMT = 'import app'
+
+
+def measure_startup(runs):
+    """Medir el tiempo de importación de la app en procesos nuevos (en segundos)"""
+    code = (
+        'import time; t = time.perf_counter(); '
+        f'{IMPORT_STMT}; '
+        'print(time.perf_counter() - t)'
+    )
+    timings = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, '-c', code],
+            cwd=ROOT, capture_output=True, text=True, check=True
+        )
+        timings.append(float(output.stdout.strip().splitlines()[-1]))
+    return timings
+
+
+def import_profile(top):
+    """
+    Obtener los módulos con mayor tiempo de importación acumulado
+
+    Returns:
+        list: Tuplas (acumulado_us, propio_us, módulo) ordenadas de mayor a menor
+    """
+    output = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', IMPORT_STMT],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    rows = []
+    for line in output.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        self_us, cumulative_us, module = line[len('import time:'):].split('|')
+        rows.append((int(cumulative_us), int(self_us), module.rstrip()))
+    rows.sort(reverse=True)
+    return rows[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark de arranque en frío')
+    parser.add_argument('--runs', type=int, default=10, help='Número de arranques a medir')
+    parser.add_argument('--top', type=int, default=20, help='Módulos a mostrar en el informe')
+    args = parser.parse_args()
+
+    timings = measure_startup(args.runs)
+    print(f'Arranque en frío ({args.runs} ejecuciones):')
+    print(f'  min     {min(timings) * 1000:8.1f} ms')
+    print(f'  mediana {statistics.median(timings) * 1000:8.1f} ms')
+    print(f'  max     {max(timings) * 1000:8.1f} ms')
+    print()
+
+    print(f'Importaciones más costosas (top {args.top}):')
+    print(f'  {"acumulado":>10}  {"propio":>8}  módulo')
+    for cumulative_us, self_us, module in import_profile(args.top):
+        print(f'  {cumulative_us / 1000:8.1f}ms  {self_us / 1000:6.1f}ms  {module}')
+
+
+if __name__ == '__main__':
+    main()
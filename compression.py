@@ -0,0 +1,124 @@
+import zlib
+import brotli
+from flask import request, current_app
+
+# Middleware de compresión de respuestas (gzip / brotli)
+
+class Compress:
+    """
+    Comprime las respuestas JSON de la API según el header Accept-Encoding.
+
+    Configuración (app.config):
+    - COMPRESS_MIMETYPES: Tipos MIME que se comprimen
+    - COMPRESS_MIN_SIZE: Tamaño mínimo en bytes para comprimir una respuesta
+    - COMPRESS_LEVEL: Nivel de compresión gzip (1-9)
+    - COMPRESS_BR_LEVEL: Calidad de compresión brotli (0-11)
+    - COMPRESS_ALGORITHMS: Algoritmos soportados en orden de preferencia
+
+    COMPRESS_MIN_SIZE, COMPRESS_LEVEL y COMPRESS_BR_LEVEL no tienen valor por
+    defecto aquí: se definen en config.py y app.py los copia a app.config.
+    """
+
+    def __init__(self, app=None):
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        """Registrar la configuración por defecto y el hook after_request"""
+        app.config.setdefault('COMPRESS_MIMETYPES', ['application/json'])
+        app.config.setdefault('COMPRESS_ALGORITHMS', ['br', 'gzip'])
+        app.after_request(self.after_request)
+
+    def choose_encoding(self, accept_encodings, algorithms):
+        """
+        Elegir el algoritmo a usar a partir del Accept-Encoding del cliente
+
+        Args:
+            accept_encodings: Objeto Accept de Werkzeug (request.accept_encodings)
+            algorithms: Algoritmos soportados en orden de preferencia
+
+        Returns:
+            str: 'br', 'gzip' o None si no hay ninguno aceptable
+        """
+        best = None
+        best_quality = 0
+        for algorithm in algorithms:
+            quality = accept_encodings[algorithm]
+            # En caso de empate se respeta el orden de preferencia del servidor
+            if quality > best_quality:
+                best = algorithm
+                best_quality = quality
+        return best
+
+    def after_request(self, response):
+        config = current_app.config
+
+        if response.mimetype not in config['COMPRESS_MIMETYPES']:
+            return response
+
+        # La respuesta varía según el Accept-Encoding aunque no se comprima
+        response.vary.add('Accept-Encoding')
+
+        if (response.status_code < 200 or response.status_code in (204, 304)
+                or response.direct_passthrough
+                or 'Content-Encoding' in response.headers):
+            return response
+
+        encoding = self.choose_encoding(request.accept_encodings, config['COMPRESS_ALGORITHMS'])
+        if not encoding:
+            return response
+
+        # El compresor se crea aquí: el stream se consume fuera del contexto de la app
+        compressor = self._compressor(encoding)
+
+        if response.is_streamed:
+            # No se conoce el tamaño final: se comprime por fragmentos
+            response.response = self._compress_stream(response.response, encoding, compressor)
+            response.headers.pop('Content-Length', None)
+        else:
+            data = response.get_data()
+            if len(data) < config['COMPRESS_MIN_SIZE']:
+                return response
+            response.set_data(self._compress(data, encoding, compressor))
+
+        response.headers['Content-Encoding'] = encoding
+
+        # La variante comprimida no es idéntica byte a byte: ETag débil propio.
+        # La vista ya comparó If-None-Match con el ETag original, así que hay
+        # que repetir la comprobación con el nuevo para poder devolver un 304.
+        etag, _ = response.get_etag()
+        if etag:
+            response.set_etag(f'{etag}-{encoding}', weak=True)
+            response.make_conditional(request)
+
+        return response
+
+    def _compressor(self, encoding):
+        """Crear un compresor incremental para el algoritmo indicado"""
+        if encoding == 'br':
+            return brotli.Compressor(quality=current_app.config['COMPRESS_BR_LEVEL'])
+        # wbits=31 genera el formato gzip (cabecera + CRC)
+        return zlib.compressobj(current_app.config['COMPRESS_LEVEL'], zlib.DEFLATED, 31)
+
+    def _compress(self, data, encoding, compressor):
+        """Comprimir un cuerpo completo"""
+        if encoding == 'br':
+            return compressor.process(data) + compressor.finish()
+        return compressor.compress(data) + compressor.flush()
+
+    def _compress_stream(self, chunks, encoding, compressor):
+        """Comprimir una respuesta en streaming fragmento a fragmento"""
+        try:
+            for chunk in chunks:
+                if isinstance(chunk, str):
+                    chunk = chunk.encode('utf-8')
+                if encoding == 'br':
+                    data = compressor.process(chunk) + compressor.flush()
+                else:
+                    data = compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+                if data:
+                    yield data
+            yield compressor.finish() if encoding == 'br' else compressor.flush()
+        finally:
+            if hasattr(chunks, 'close'):
+                chunks.close()
@@ -0,0 +1,28 @@
+from dotenv import load_dotenv
+import os
+
+# Cargar variables de entorno (una única vez para toda la aplicación)
+load_dotenv()
+
+# Base de datos
+MONGODB_URI = os.getenv('MONGODB_URI')
+
+# Autenticación
+SESSION_SECRET = os.getenv('SESSION_SECRET')
+JWT_SECRET = os.getenv('JWT_SECRET')
+GOOGLE_CLIENT_ID = os.getenv('GOOGLE_CLIENT_ID')
+
+# Cloudinary
+CLOUDINARY_URL = os.getenv('CLOUDINARY_URL')
+
+# Compresión de respuestas
+COMPRESS_MIN_SIZE = int(os.getenv('COMPRESS_MIN_SIZE', 500))
+COMPRESS_LEVEL = int(os.getenv('COMPRESS_LEVEL', 6))
+COMPRESS_BR_LEVEL = int(os.getenv('COMPRESS_BR_LEVEL', 4))
+
+# Subida de archivos (tamaños en bytes)
+MAX_CONTENT_LENGTH = int(os.getenv('MAX_CONTENT_LENGTH', 25 * 1024 * 1024))  # Por petición
+MAX_FILE_SIZE = int(os.getenv('MAX_FILE_SIZE', 10 * 1024 * 1024))  # Por archivo
+MAX_FORM_MEMORY_SIZE = int(os.getenv('MAX_FORM_MEMORY_SIZE', 500 * 1024))  # Campos de texto
+UPLOAD_SPOOL_SIZE = int(os.getenv('UPLOAD_SPOOL_SIZE', 512 * 1024))  # A disco por encima de este tamaño
+UPLOAD_CHUNK_SIZE = int(os.getenv('UPLOAD_CHUNK_SIZE', 6 * 1024 * 1024))  # Trozos enviados a Cloudinary (mín. 5 MB)
@@ -1,9 +1,4 @@
-from pymongo import MongoClient
-from dotenv import load_dotenv
-import os
-
-# Cargar variables de entorno
-load_dotenv()
+import config
 
 class Database:
     def __init__(self):
@@ -13,8 +8,9 @@ class Database:
     def connect(self):
         """Conectar a MongoDB Atlas"""
         if self.client is None:
-            mongodb_uri = os.getenv('MONGODB_URI')
-            self.client = MongoClient(mongodb_uri)
+            # Importación diferida: pymongo solo se carga al primer acceso a la BD
+            from pymongo import MongoClient
+            self.client = MongoClient(config.MONGODB_URI)
             # Obtener el nombre de la base de datos de la URI o usar uno por defecto
             self.db = self.client['reviews']
             print("Conectado a MongoDB Atlas")
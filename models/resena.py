@@ -1,4 +1,3 @@
-from bson import ObjectId
 from datetime import datetime
 
 class Resena:
@@ -24,7 +23,11 @@ class Resena:
     def __init__(self, nombre_establecimiento, direccion, latitud, longitud, 
                  valoracion, imagenes_uri, autor_email, autor_nombre, token, 
                  token_emision, token_caducidad, _id=None, created_at=None):
-        self._id = _id if _id else ObjectId()
+        if not _id:
+            # Importación diferida: bson forma parte de pymongo
+            from bson import ObjectId
+            _id = ObjectId()
+        self._id = _id
         self.nombre_establecimiento = nombre_establecimiento
         self.direccion = direccion
         self.latitud = latitud
@@ -1,11 +1,11 @@
 from flask import Blueprint, request, jsonify
-from bson import ObjectId
 from database import db
 from models.resena import Resena
 from services.geocoding_service import geocode_address
 from services.cloudinary_service import upload_image
 from datetime import datetime
 from auth import token_required
+from uploads import upload_limits, is_allowed_image
 
 resenas_bp = Blueprint('resenas', __name__)
 
@@ -30,6 +30,8 @@ def get_resenas(user_data):
 @resenas_bp.route('/<id>', methods=['GET'])
 @token_required
 def get_resena(user_data, id):
+    from bson import ObjectId
+
     try:
         collection = db.get_collection('resenas')
         resena_data = collection.find_one({'_id': ObjectId(id)})
@@ -45,6 +47,7 @@ def get_resena(user_data, id):
 # Crear una nueva reseña con imágenes
 @resenas_bp.route('', methods=['POST'])
 @token_required
+@upload_limits
 def create_resena(user_data):
     try:
         # Obtener datos del formulario
@@ -80,7 +83,7 @@ def create_resena(user_data):
                     allowed_extensions = {'png', 'jpg', 'jpeg', 'gif', 'webp'}
                     file_extension = file.filename.rsplit('.', 1)[1].lower() if '.' in file.filename else ''
                     
-                    if file_extension in allowed_extensions:
+                    if file_extension in allowed_extensions and is_allowed_image(file):
                         result = upload_image(file, folder='reviews')
                         if result:
                             imagenes_uri.append(result['url'])
@@ -118,6 +121,8 @@ def create_resena(user_data):
 @resenas_bp.route('/<id>', methods=['DELETE'])
 @token_required
 def delete_resena(user_data, id):
+    from bson import ObjectId
+
     try:
         collection = db.get_collection('resenas')
         
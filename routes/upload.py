@@ -1,6 +1,7 @@
 from flask import Blueprint, request, jsonify
 from services.cloudinary_service import upload_image, delete_image
 from auth import token_required
+from uploads import upload_limits, is_allowed_image
 
 upload_bp = Blueprint('upload', __name__)
 
@@ -13,6 +14,7 @@ def upload_image_endpoint():
     from auth import token_required
     
     @token_required
+    @upload_limits
     def _upload(user_data):
         try:
             # Verificar que se envió un archivo
@@ -32,6 +34,10 @@ def upload_image_endpoint():
             if file_extension not in allowed_extensions:
                 return jsonify({'error': f'Tipo de archivo no permitido. Use: {", ".join(allowed_extensions)}'}), 400
             
+            # Verificar que el contenido es realmente una imagen
+            if not is_allowed_image(file):
+                return jsonify({'error': 'El archivo no es una imagen válida'}), 415
+            
             # Obtener carpeta opcional del query string
             folder = request.args.get('folder', 'cineweb')
             
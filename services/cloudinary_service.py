@@ -1,30 +1,51 @@
-import cloudinary
-import cloudinary.uploader
-import os
-from dotenv import load_dotenv
+from flask import current_app
+import config
 
-load_dotenv()
+_cloudinary = None
 
-# Configurar Cloudinary
-cloudinary.config(
-    cloudinary_url=os.getenv('CLOUDINARY_URL')
-)
+def _get_cloudinary():
+    """
+    Importar y configurar Cloudinary en el primer uso
+
+    Returns:
+        module: Módulo cloudinary ya configurado
+    """
+    global _cloudinary
+    if _cloudinary is None:
+        import cloudinary
+        import cloudinary.uploader
+
+        # Configurar Cloudinary
+        cloudinary.config(
+            cloudinary_url=config.CLOUDINARY_URL
+        )
+        _cloudinary = cloudinary
+    return _cloudinary
 
 def upload_image(file, folder="reviews"):
     """
     Subir una imagen a Cloudinary
     
     Args:
-        file: Archivo de imagen (FileStorage de Flask)
+        file: Archivo de imagen (FileStorage de Flask o stream binario)
         folder: Carpeta en Cloudinary donde guardar la imagen
         
     Returns:
         dict: Diccionario con 'url' y 'public_id' si éxito, None si falla
     """
     try:
+        cloudinary = _get_cloudinary()
+
+        # Enviar el stream por trozos: en memoria solo hay un trozo a la vez
+        # (la imagen entera si ocupa menos de UPLOAD_CHUNK_SIZE)
+        stream = getattr(file, 'stream', file)
+        stream.seek(0)
+
         # Subir imagen a Cloudinary
-        result = cloudinary.uploader.upload(
-            file,
+        result = cloudinary.uploader.upload_large(
+            stream,
+            filename=getattr(file, 'filename', None) or 'stream',
+            chunk_size=current_app.config['UPLOAD_CHUNK_SIZE'],
             folder=folder,
             resource_type="image",
             transformation=[
@@ -52,6 +73,7 @@ def delete_image(public_id):
         bool: True si se eliminó exitosamente, False si falló
     """
     try:
+        cloudinary = _get_cloudinary()
         result = cloudinary.uploader.destroy(public_id)
         return result.get('result') == 'ok'
     except Exception as e:
@@ -70,6 +92,7 @@ def get_image_url(public_id, transformations=None):
         str: URL de la imagen
     """
     try:
+        cloudinary = _get_cloudinary()
         if transformations:
             return cloudinary.CloudinaryImage(public_id).build_url(transformation=transformations)
         return cloudinary.CloudinaryImage(public_id).build_url()
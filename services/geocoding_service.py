@@ -1,4 +1,3 @@
-import requests
 from typing import Optional, Dict
 
 def geocode_address(address: str) -> Optional[Dict[str, float]]:
@@ -12,6 +11,9 @@ def geocode_address(address: str) -> Optional[Dict[str, float]]:
         dict: {'latitud': float, 'longitud': float} o None si falla
     """
     try:
+        # Importación diferida: requests solo se carga al geocodificar
+        import requests
+
         # API de Nominatim (OpenStreetMap)
         base_url = "https://nominatim.openstreetmap.org/search"
         
@@ -56,6 +58,8 @@ def reverse_geocode(latitud: float, longitud: float) -> Optional[str]:
         str: Dirección formateada o None si falla
     """
     try:
+        import requests
+
         base_url = "https://nominatim.openstreetmap.org/reverse"
         
         params = {
@@ -0,0 +1,44 @@
+import gzip
+import pytest
+from flask import Flask, jsonify, request
+import config
+from compression import Compress
+
+
+@pytest.fixture
+def client():
+    app = Flask(__name__)
+    app.config['COMPRESS_MIN_SIZE'] = config.COMPRESS_MIN_SIZE
+    app.config['COMPRESS_LEVEL'] = config.COMPRESS_LEVEL
+    app.config['COMPRESS_BR_LEVEL'] = config.COMPRESS_BR_LEVEL
+    Compress(app)
+
+    @app.route('/resenas')
+    def resenas():
+        response = jsonify([{'autor_email': 'a@example.com', 'imagenes_uri': []}] * 100)
+        response.set_etag('abc')
+        return response.make_conditional(request)
+
+    return app.test_client()
+
+
+def test_compressed_response_has_weak_etag(client):
+    response = client.get('/resenas', headers={'Accept-Encoding': 'gzip'})
+
+    assert response.status_code == 200
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert response.headers['ETag'] == 'W/"abc-gzip"'
+    assert gzip.decompress(response.data).startswith(b'[{')
+
+
+def test_compressed_etag_revalidates_with_304(client):
+    first = client.get('/resenas', headers={'Accept-Encoding': 'gzip'})
+
+    response = client.get('/resenas', headers={
+        'Accept-Encoding': 'gzip',
+        'If-None-Match': first.headers['ETag'],
+    })
+
+    assert response.status_code == 304
+    assert response.headers['ETag'] == 'W/"abc-gzip"'
+    assert response.data == b''
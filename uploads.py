@@ -0,0 +1,118 @@
+from functools import wraps
+from tempfile import SpooledTemporaryFile
+from flask import Request, request, jsonify, current_app
+from werkzeug.exceptions import RequestEntityTooLarge
+
+#Logica de limitación y validación de subidas de archivos
+
+# Bytes necesarios para identificar el formato de una imagen
+SNIFF_SIZE = 12
+
+def sniff_image_type(header):
+    """
+    Identificar el formato de una imagen a partir de sus primeros bytes (magic bytes)
+
+    Args:
+        header: Primeros bytes del archivo
+
+    Returns:
+        str: 'png', 'jpg', 'gif' o 'webp', None si no es un formato permitido
+    """
+    if header.startswith(b'\x89PNG\r\n\x1a\n'):
+        return 'png'
+    if header.startswith(b'\xff\xd8\xff'):
+        return 'jpg'
+    if header.startswith((b'GIF87a', b'GIF89a')):
+        return 'gif'
+    if header[:4] == b'RIFF' and header[8:12] == b'WEBP':
+        return 'webp'
+    return None
+
+def is_allowed_image(file):
+    """Comprobar por su contenido que un FileStorage subido es una imagen permitida"""
+    stream = file.stream
+    # Archivo ya descartado durante la recepción
+    if getattr(stream, 'rejected', False):
+        return False
+    stream.seek(0)
+    header = stream.read(SNIFF_SIZE)
+    stream.seek(0)
+    return sniff_image_type(header) is not None
+
+class FileTooLarge(RequestEntityTooLarge):
+    """Un archivo subido supera MAX_FILE_SIZE"""
+
+class LimitedSpooledFile(SpooledTemporaryFile):
+    """
+    Archivo temporal para las partes de archivo de un multipart.
+
+    Se mantiene en memoria hasta UPLOAD_SPOOL_SIZE bytes y después se vuelca
+    a disco. Rechaza la subida en cuanto se supera MAX_FILE_SIZE. Si los
+    primeros bytes recibidos no corresponden a una imagen permitida, el
+    archivo se marca como rechazado y el resto de su contenido se descarta.
+    """
+
+    def __init__(self, spool_size, max_file_size):
+        super().__init__(max_size=spool_size, mode='rb+')
+        self.max_file_size = max_file_size
+        self.bytes_written = 0
+        self.header = b''
+        self.rejected = False
+
+    def write(self, data):
+        self.bytes_written += len(data)
+        if self.max_file_size is not None and self.bytes_written > self.max_file_size:
+            raise FileTooLarge()
+
+        # Validar el tipo con el primer fragmento, antes de seguir leyendo
+        if len(self.header) < SNIFF_SIZE:
+            self.header += bytes(data[:SNIFF_SIZE - len(self.header)])
+            if len(self.header) == SNIFF_SIZE and not sniff_image_type(self.header):
+                self.rejected = True
+
+        if self.rejected:
+            return len(data)
+        return super().write(data)
+
+class UploadRequest(Request):
+    """
+    Request de Flask que guarda los archivos subidos en LimitedSpooledFile.
+
+    Solo se aplica en las vistas decoradas con upload_limits; el resto usa
+    el almacenamiento por defecto de Werkzeug.
+    """
+
+    limit_uploads = False
+
+    def _get_file_stream(self, total_content_length, content_type, filename=None,
+                         content_length=None):
+        if not self.limit_uploads:
+            return super()._get_file_stream(total_content_length, content_type,
+                                            filename, content_length)
+        return LimitedSpooledFile(
+            spool_size=current_app.config['UPLOAD_SPOOL_SIZE'],
+            max_file_size=current_app.config['MAX_FILE_SIZE']
+        )
+
+def upload_limits(f):
+    """Decorador que aplica los límites de subida antes de ejecutar la vista"""
+    @wraps(f)
+    def decorated(*args, **kwargs):
+        # Rechazo temprano por Content-Length, sin leer el cuerpo
+        max_content_length = current_app.config['MAX_CONTENT_LENGTH']
+        if (max_content_length is not None and request.content_length is not None
+                and request.content_length > max_content_length):
+            return jsonify({'error': 'La petición supera el tamaño máximo permitido'}), 413
+
+        # Forzar aquí el parseo del multipart para devolver el error adecuado
+        request.limit_uploads = True
+        try:
+            request.files
+        except FileTooLarge:
+            return jsonify({'error': 'El archivo supera el tamaño máximo permitido'}), 413
+        except RequestEntityTooLarge:
+            return jsonify({'error': 'La petición supera el tamaño máximo permitido'}), 413
+
+        return f(*args, **kwargs)
+
+    return decorated